@@ -5,6 +5,14 @@ TEST_REMOTE_HOST = NetworkAddress("127.0.0.1", 23817)
 # TEST_REMOTE_HOST = NetworkAddress("192.168.200.151", 23817)
 # infinity thrift server port
 infinity_server_port = 23817
+# network.connection_limit of the server, thrift serves every connection on its own thread
+infinity_connection_limit = 128
+# connections of the session-wide infinity_pool fixture
+infinity_pool_size = 8
+# max connections of the pool used by the 1K/1M table stress tests
+stress_pool_size = 32
+# threads, each with its own connection, of the concurrent create/drop conflict test
+conflict_thread_count = 16
 
 identifier_limit = 65536
 database_count_limit = 65536
@@ -56,7 +64,7 @@ invalid_name_array = [
     'name-12',
     '12name',
     '数据库名',
-    ''.join('x' for i in range(identifier_limit + 1)),
+    'x' * (identifier_limit + 1),
     None,
 ]
 
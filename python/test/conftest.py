@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
 import os
 from shutil import copyfile
 
@@ -20,6 +21,7 @@ from infinity.errors import ErrorCode
 from infinity.remote_thrift.client import ThriftInfinityClient
 
 from common import common_values
+from utils import ConnectionPool
 
 
 @pytest.fixture(scope="function")
@@ -33,18 +35,45 @@ def disconnect_infinity():
     assert res.error_code == ErrorCode.OK
 
 
-@pytest.fixture(scope="function")
-def get_infinity_db():
-    # connect
-    infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
+@pytest.fixture(scope="session")
+def infinity_obj():
+    # one connection shared by the whole test session
+    conn = infinity.connect(common_values.TEST_REMOTE_HOST)
 
-    yield infinity_obj.get_database("default")
+    yield conn
 
-    # disconnect
-    res = infinity_obj.disconnect()
+    res = conn.disconnect()
     assert res.error_code == ErrorCode.OK
 
 
+@pytest.fixture(scope="session")
+def db_obj(infinity_obj):
+    return infinity_obj.get_database("default")
+
+
+@pytest.fixture(scope="session")
+def get_infinity_db(db_obj):
+    # the default database on the session connection, instead of a new connection for every test
+    return db_obj
+
+
+@pytest.fixture(scope="session")
+def infinity_pool():
+    # connections for tests that issue RPCs from several threads
+    pool = ConnectionPool(common_values.TEST_REMOTE_HOST, common_values.infinity_pool_size)
+
+    yield pool
+
+    pool.disconnect()
+
+
+@pytest.fixture(scope="function")
+def table_name(request):
+    # unique for every test node, so that tests running in parallel under pytest-xdist never share a table
+    digest = hashlib.md5(request.node.nodeid.encode()).hexdigest()[:8]
+    return f"{request.node.originalname}_{digest}"
+
+
 @pytest.fixture(scope="class")
 def check_data(request):
     file_name = request.param["file_name"]
@@ -58,6 +87,16 @@ def check_data(request):
     return True
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    # a worker holds at once the session connection, infinity_pool and the connections of whichever of the
+    # stress tests or the concurrent conflict test is running (both close theirs when done), so `-n auto`
+    # must not start more workers than the server can serve
+    worker_connections = 1 + common_values.infinity_pool_size + max(common_values.stress_pool_size,
+                                                                    common_values.conflict_thread_count)
+    return max(1, min(os.cpu_count() or 1, common_values.infinity_connection_limit // worker_connections))
+
+
 def disable_items_with_mark(items, mark, reason):
     skipper = pytest.mark.skip(reason=reason)
     for item in items:
@@ -12,22 +12,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import concurrent.futures
+import re
+import threading
 import pytest
-import polars as pl
 
 from common import common_values
 from infinity.common import ConflictType
 import infinity
 from infinity.errors import ErrorCode
-from utils import trace_expected_exceptions
+from utils import ConnectionPool
+
+_VALID_TYPES = (
+    "int", "int8", "int16", "int32", "int64", "integer",
+    "float", "float32", "double", "float64",
+    "varchar",
+    "bool",
+    "vector, 3, float",
+)
+
+_INVALID_CREATE_RE = re.compile(r"ERROR:3066, Invalid conflict type")
+_INVALID_DROP_RE = re.compile(r"ERROR:3066, invalid conflict type")
 
 
 class TestTable:
 
+    @pytest.fixture(autouse=True)
+    def clean_table(self, request):
+        # every test working on a table starts and ends without it, the others need no connection at all
+        if "table_name" not in request.fixturenames:
+            yield
+            return
+        db_obj = request.getfixturevalue("db_obj")
+        table_name = request.getfixturevalue("table_name")
+        db_obj.drop_table(table_name, ConflictType.Ignore)
+        yield
+        db_obj.drop_table(table_name, ConflictType.Ignore)
+
     def test_version(self):
         print(infinity.__version__)
 
-    def test_table(self):
+    def test_table(self, db_obj, table_name):
         """
         target: test table apis
         method:
@@ -57,13 +81,9 @@ class TestTable:
         4. list tables: empty
         expect: all operations successfully
         """
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("my_table")
-
         # infinity
         tb = db_obj.create_table(
-            "my_table", {"c1": "int, primary key", "c2": "float"}, ConflictType.Error)
+            table_name, {"c1": "int, primary key", "c2": "float"}, ConflictType.Error)
         assert tb is not None
 
         with pytest.raises(Exception):
@@ -87,145 +107,64 @@ class TestTable:
         res = db_obj.list_tables()
         assert res.error_code == ErrorCode.OK
 
-        res = db_obj.drop_table("my_table")
+        res = db_obj.drop_table(table_name)
         assert res.error_code == ErrorCode.OK
 
         res = db_obj.list_tables()
         assert res.error_code == ErrorCode.OK
 
-        # disconnect
-        res = infinity_obj.disconnect()
-        assert res.error_code == ErrorCode.OK
-
-    def test_show_tables(self):
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-
-        db = infinity_obj.get_database("default")
+    def test_show_tables(self, db_obj):
+        import polars as pl
 
         with pl.Config(fmt_str_lengths=1000):
-            res = db.show_tables()
+            res = db_obj.show_tables()
             print(res)
             # check the polars dataframe
             assert res.columns == ["database", "table", "type", "column_count", "block_count", "block_capacity",
                                    "segment_count", "segment_capacity"]
 
-    def test_create_varchar_table(self):
+    def test_create_varchar_table(self, db_obj, table_name):
         """
         target: test create table with varchar column
         method: create table with varchar column
         expected: ok
         """
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("test_create_varchar_table", ConflictType.Ignore)
-        table_obj = db_obj.create_table("test_create_varchar_table", {
+        table_obj = db_obj.create_table(table_name, {
             "c1": "varchar, primary key", "c2": "float"}, ConflictType.Error)
         assert table_obj
 
-        db_obj.drop_table("test_create_varchar_table")
+        db_obj.drop_table(table_name)
 
-    def test_create_embedding_table(self):
+    def test_create_embedding_table(self, db_obj, table_name):
         """
         target: test create table with embedding column
         method: create table with embedding column
         expected: ok
         """
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("test_create_embedding_table", ConflictType.Ignore)
-        table_obj = db_obj.create_table("test_create_embedding_table", {
+        table_obj = db_obj.create_table(table_name, {
             "c1": "vector,128,float"}, ConflictType.Error)
         assert table_obj
 
-        db_obj.drop_table("test_create_embedding_table")
-
-    def test_create_table_with_invalid_column_name(self):
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        with pytest.raises(Exception):
-            db_obj = infinity_obj.get_database("default")
-            db_obj.drop_table("test_create_invalid_column_name", ConflictType.Ignore)
-            table_obj = db_obj.create_table("test_create_invalid_column_name", {
-                "": "vector,128,float"}, ConflictType.Error)
-            assert table_obj
-            db_obj.drop_table("test_create_invalid_column_name")
-
-        with pytest.raises(Exception):
-            db_obj = infinity_obj.get_database("default")
-            db_obj.drop_table("test_create_invalid_column_name", ConflictType.Ignore)
-            table_obj = db_obj.create_table("test_create_invalid_column_name", {
-                " ": "vector,128,float"}, ConflictType.Error)
-            assert table_obj
-            db_obj.drop_table("test_create_invalid_column_name")
-
-        with pytest.raises(Exception):
-            db_obj = infinity_obj.get_database("default")
-            db_obj.drop_table("test_create_invalid_column_name", ConflictType.Ignore)
-            table_obj = db_obj.create_table("test_create_invalid_column_name", {
-                "12": "vector,128,float"}, ConflictType.Error)
-            assert table_obj
-            db_obj.drop_table("test_create_invalid_column_name")
-
-        with pytest.raises(Exception):
-            db_obj = infinity_obj.get_database("default")
-            db_obj.drop_table("test_create_invalid_column_name", ConflictType.Ignore)
-            table_obj = db_obj.create_table("test_create_invalid_column_name", {
-                "[]": "vector,128,float"}, ConflictType.Error)
-            assert table_obj
-            db_obj.drop_table("test_create_invalid_column_name")
-
-        with pytest.raises(Exception):
-            db_obj = infinity_obj.get_database("default")
-            db_obj.drop_table("test_create_invalid_column_name", ConflictType.Ignore)
-            table_obj = db_obj.create_table("test_create_invalid_column_name", {
-                "()": "vector,128,float"}, ConflictType.Error)
-            assert table_obj
-            db_obj.drop_table("test_create_invalid_column_name")
-
-        with pytest.raises(Exception):
-            db_obj = infinity_obj.get_database("default")
-            db_obj.drop_table("test_create_invalid_column_name", ConflictType.Ignore)
-            table_obj = db_obj.create_table("test_create_invalid_column_name", {
-                "{}": "vector,128,float"}, ConflictType.Error)
-            assert table_obj
-            db_obj.drop_table("test_create_invalid_column_name")
+        db_obj.drop_table(table_name)
 
+    @pytest.mark.parametrize("bad_name", ["", " ", "12", "[]", "()", "{}", "1", "1.1"])
+    def test_create_table_with_invalid_column_name(self, db_obj, table_name, bad_name):
         with pytest.raises(Exception):
-            db_obj = infinity_obj.get_database("default")
-            db_obj.drop_table("test_create_invalid_column_name", ConflictType.Ignore)
-            table_obj = db_obj.create_table("test_create_invalid_column_name", {
-                "1": "vector,128,float"}, ConflictType.Error)
-            assert table_obj
-            db_obj.drop_table("test_create_invalid_column_name")
-
-        with pytest.raises(Exception):
-            db_obj = infinity_obj.get_database("default")
-            db_obj.drop_table("test_create_invalid_column_name", ConflictType.Ignore)
-            table_obj = db_obj.create_table("test_create_invalid_column_name", {
-                "1.1": "vector,128,float"}, ConflictType.Error)
-            assert table_obj
-            db_obj.drop_table("test_create_invalid_column_name")
+            db_obj.create_table(table_name, {bad_name: "vector,128,float"}, ConflictType.Error)
 
     @pytest.mark.parametrize("column_name", common_values.invalid_name_array)
-    def test_create_table_with_invalid_column_name_python(self, column_name):
+    def test_create_table_with_invalid_column_name_python(self, db_obj, table_name, column_name):
         """
         target: create with invalid column name
         methods: create table with invalid column name
         expect: all operations throw exception on python side
         """
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("my_table", ConflictType.Ignore)
-
         try:
-            tb = db_obj.create_table("my_table", {column_name: "int"}, ConflictType.Error)
+            tb = db_obj.create_table(table_name, {column_name: "int"}, ConflictType.Error)
         except Exception as e:
             print(e)
 
-        # disconnect
-        res = infinity_obj.disconnect()
-        assert res.error_code == ErrorCode.OK
-
-    def test_table_with_different_column_name(self):
+    def test_table_with_different_column_name(self, db_obj, table_name):
         """
         target: test create/drop/show/get valid table name with different column names
         methods:
@@ -236,47 +175,35 @@ class TestTable:
         expect: all operations successfully
 
         """
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("my_table", ConflictType.Ignore)
-
         for column_name in common_values.invalid_name_array:
             try:
-                tb = db_obj.create_table("my_table", {column_name: "int"}, ConflictType.Error)
+                tb = db_obj.create_table(table_name, {column_name: "int"}, ConflictType.Error)
                 raise Exception(f"Can create column_name: {column_name}")
             except Exception as e:
                 print(e)
 
-            # list table
-            try:
-                res = db_obj.list_tables()
-            except Exception as e:
-                print(e)
-
-            # get table
-            try:
-                res = db_obj.get_table("my_table")
-            except Exception as e:
-                print(e)
-
-            # drop table
-            try:
-                res = db_obj.drop_table("my_table")
-            except Exception as e:
-                print(e)
-        # FIXME: res = db_obj.show_table("my_table")
+        # every create above is rejected, so the table is checked once afterwards instead of after each attempt
+        # list table
+        try:
+            res = db_obj.list_tables()
+        except Exception as e:
+            print(e)
 
-        # disconnect
-        # res = infinity_obj.disconnect()
-        # assert res
+        # get table
+        try:
+            res = db_obj.get_table(table_name)
+        except Exception as e:
+            print(e)
 
+        # drop table
         try:
-            res = infinity_obj.disconnect()
+            res = db_obj.drop_table(table_name)
         except Exception as e:
             print(e)
+        # FIXME: res = db_obj.show_table("my_table")
 
     # create/drop/show/get valid table name with different column types
-    def test_table_with_different_column_types(self):
+    def test_table_with_different_column_types(self, db_obj, table_name):
         """
         target: test create/drop/show/get valid table name with different column types
         methods:
@@ -315,20 +242,16 @@ class TestTable:
         expect: all operations successfully
 
         """
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("my_table", ConflictType.Ignore)
-
         # infinity
         tb = db_obj.create_table(
-            "my_table", {"c1": "bool, primary key", "c2": "int", "c3": "int8", "c4": "int16",
+            table_name, {"c1": "bool, primary key", "c2": "int", "c3": "int8", "c4": "int16",
                          "c5": "int32", "c6": "int64", "c7": "int128", "c8": "float", "c9": "float32",
                          "c10": "double", "c11": "float64", "c12": "varchar", "c13": "integer"}, ConflictType.Error)
         assert tb is not None
 
         for tb_type in common_values.invalid_name_array:
             try:
-                tb = db_obj.create_table("my_table", {"c1": tb_type}, ConflictType.Error)
+                tb = db_obj.create_table(table_name, {"c1": tb_type}, ConflictType.Error)
                 raise Exception(f"Can create tb: {tb_type}")
             except Exception as e:
                 print(e)
@@ -341,29 +264,21 @@ class TestTable:
 
         # get table
         try:
-            res = db_obj.get_table("my_table")
+            res = db_obj.get_table(table_name)
         except Exception as e:
             print(e)
 
         # drop table
-        res = db_obj.drop_table("my_table")
-        assert res.error_code == ErrorCode.OK
-
-        # disconnect
-        res = infinity_obj.disconnect()
+        res = db_obj.drop_table(table_name)
         assert res.error_code == ErrorCode.OK
 
     # create/drop/show/get table with 10000 columns with various column types.
-    def test_table_with_various_column_types(self):
+    def test_table_with_various_column_types(self, db_obj, table_name):
         """
         target: create/drop/show/get table with 10000 columns with various column types.
         methods: create table with various column types
         expect: all operations successfully
         """
-        # connect
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("my_table", ConflictType.Ignore)
         c_count = 10000
 
         types = [
@@ -371,15 +286,11 @@ class TestTable:
             "float32", "double", "float64", "varchar", "integer", "bool",
         ]
         # make params
-        params = {}
-        for i in range(c_count - 13):
-            params.update({
-                "c" + str(i): types[i % 13]
-            })
+        params = {"c" + str(i): types[i % 13] for i in range(c_count - 13)}
 
         # create tb with 10000 columns with various column types
         try:
-            tb = db_obj.create_table('my_table', params, ConflictType.Error)
+            tb = db_obj.create_table(table_name, params, ConflictType.Error)
         except Exception as e:
             print(e)
 
@@ -391,17 +302,13 @@ class TestTable:
 
         # get table
         try:
-            res = db_obj.get_table("my_table")
+            res = db_obj.get_table(table_name)
             print(res.output(["c2"]))
         except Exception as e:
             print(e)
 
         # drop table
-        res = db_obj.drop_table("my_table")
-        assert res.error_code == ErrorCode.OK
-
-        # disconnect
-        res = infinity_obj.disconnect()
+        res = db_obj.drop_table(table_name)
         assert res.error_code == ErrorCode.OK
 
     # create/drop table with different invalid options
@@ -416,30 +323,22 @@ class TestTable:
         pytest.param('name-12'),
         pytest.param('12name'),
         pytest.param('数据库名'),
-        pytest.param(''.join('x' for i in range(65536 + 1))),
+        pytest.param('x' * (65536 + 1)),
         None,
-    ])
-    def test_table_with_different_invalid_options(self, get_infinity_db, invalid_option_array):
+    ], ids=["list", "tuple", "dict", "float", "empty", "space", "digits", "name-12", "12name", "cn", "longstr", "none"])
+    def test_table_with_different_invalid_options(self, db_obj, table_name, invalid_option_array):
         """
         target: create/drop table with different invalid options.
         methods: create table with various options
         expect: all operations successfully
         """
-        db_obj = get_infinity_db
-        db_obj.drop_table("test_table_with_different_invalid_options", ConflictType.Ignore)
-
-        with pytest.raises(Exception, match="ERROR:3066, Invalid conflict type"):
-            db_obj.create_table("test_table_with_different_invalid_options", {"c1": "int"}, invalid_option_array)
+        with pytest.raises(Exception, match=_INVALID_CREATE_RE):
+            db_obj.create_table(table_name, {"c1": "int"}, invalid_option_array)
 
     # create/drop/show/get 1000 tables with 10000 columns with various column types.
     @pytest.mark.slow
     @pytest.mark.skip(reason="Cost too much times,and may cause the serve to terminate")
-    def test_various_tables_with_various_columns(self):
-        # connect
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("my_table", ConflictType.Ignore)
-
+    def test_various_tables_with_various_columns(self, db_obj, table_name):
         tb_count = 1000
         column_count = 10000
 
@@ -449,26 +348,29 @@ class TestTable:
         ]
 
         # make params
-        params = {}
-        for i in range(column_count - 13):
-            params.update({
-                "c" + str(i): types[i % 13]
-            })
+        params = {"c" + str(i): types[i % 13] for i in range(column_count - 13)}
 
         for i in range(tb_count):
             try:
-                tb = db_obj.create_table("my_table" + str(i), params, ConflictType.Error)
+                tb = db_obj.create_table(table_name + str(i), params, ConflictType.Error)
                 print(i)
                 # raise Exception(f"Can create table")
             except Exception as e:
                 print(e)
 
-        # disconnect
+    def test_disconnect(self):
+        """
+        target: disconnect a connection
+        methods: connect, then disconnect
+        expect: disconnect successfully, the other tests leave it to the session fixture
+        """
+        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
         res = infinity_obj.disconnect()
         assert res.error_code == ErrorCode.OK
 
     # after disconnection, create / drop / show / list / get table
-    def test_after_disconnect_use_table(self):
+    @pytest.mark.serial
+    def test_after_disconnect_use_table(self, table_name):
         """
         target: after disconnection, create / drop / show / list / get table
         methods:
@@ -476,10 +378,9 @@ class TestTable:
         2. create / drop / show / list / get table
         expect: all operations successfully
         """
-        # connect
+        # connect, not shared with the session fixture since it gets disconnected here
         infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
         db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("my_table", ConflictType.Ignore)
 
         # disconnect
         res = infinity_obj.disconnect()
@@ -487,13 +388,13 @@ class TestTable:
 
         # create table
         try:
-            res = db_obj.create_table("my_table", {"c1": "int"}, ConflictType.Error)
+            res = db_obj.create_table(table_name, {"c1": "int"}, ConflictType.Error)
         except Exception as e:
             print(e)
 
         # drop table
         try:
-            res = db_obj.drop_table("my_table")
+            res = db_obj.drop_table(table_name)
         except Exception as e:
             print(e)
 
@@ -507,71 +408,49 @@ class TestTable:
 
         # get table
         try:
-            res = db_obj.get_table("my_table")
+            res = db_obj.get_table(table_name)
         except Exception as e:
             print(e)
 
     # create/drop table with invalid options
-    def test_table_with_invalid_options(self):
+    def test_table_with_invalid_options(self, db_obj, table_name):
         """
         target: create/drop table with invalid options.
         methods: create table with various options
         expect: all operations successfully
         """
-        # connect
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("my_table", ConflictType.Ignore)
-
         for option_name in common_values.invalid_name_array:
             try:
-                tb = db_obj.create_table("my_table", {"c1": "int"}, option_name)
+                tb = db_obj.create_table(table_name, {"c1": "int"}, option_name)
                 # raise Exception(f"Can create option_name: {option_name}")
             except Exception as e:
                 print(e)
 
-        # disconnect
-        res = infinity_obj.disconnect()
-        assert res.error_code == ErrorCode.OK
-        # try:
-        #     res = infinity_obj.disconnect()
-        # except Exception as e:
-        #     print(e)
-
     # create created table, drop dropped table.
-    def test_create_drop_table(self):
+    def test_create_drop_table(self, db_obj, table_name):
         """
         target: create created table, drop dropped table
         methods: create table ,drop table
         expect: all operations successfully
         """
-        # connect
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("my_table", ConflictType.Ignore)
-
         # create
         tb = db_obj.create_table(
-            "my_table", {"c1": "int, primary key", "c2": "float"}, ConflictType.Error)
+            table_name, {"c1": "int, primary key", "c2": "float"}, ConflictType.Error)
         assert tb is not None
 
         try:
-            tb = db_obj.create_table("my_table", {"c1": "int"}, ConflictType.Error)
+            tb = db_obj.create_table(table_name, {"c1": "int"}, ConflictType.Error)
         except Exception as e:
             print(e)
 
         # drop
-        db_obj.drop_table("my_table")
+        db_obj.drop_table(table_name)
 
         try:
-            tb = db_obj.drop_table("my_table")
+            tb = db_obj.drop_table(table_name)
         except Exception as e:
             print(e)
 
-        # disconnect
-        res = infinity_obj.disconnect()
-        assert res.error_code == ErrorCode.OK
-
     # show created table, show not-created table, show dropped table
     @pytest.mark.skip(reason="Feature request")
     def test_describe_various_table(self):
@@ -583,293 +462,177 @@ class TestTable:
         pass
 
     # create/drop/list/get 1K table to reach the limit
-    def test_create_1K_table(self):
+    def test_create_1K_table(self, db_obj, table_name):
         """
         target: create/drop/list/get 1K table
         methods: show table
         expect: all operations successfully
         """
-        # connect
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("my_table", ConflictType.Ignore)
-
         tb_count = 1000
-        for i in range(tb_count):
-            try:
-                tb = db_obj.create_table("my_table" + str(i), {"c1": "int"}, ConflictType.Error)
-            except Exception as e:
-                print(e)
-
-        # list table
+        pool = ConnectionPool(common_values.TEST_REMOTE_HOST, min(common_values.stress_pool_size, tb_count))
         try:
-            res = db_obj.list_tables()
-            print(res)
-        except Exception as e:
-            print(e)
+            pool.map(lambda db, i: db.create_table(table_name + str(i), {"c1": "int"}, ConflictType.Error),
+                     range(tb_count))
 
-        # get table
-        for i in range(tb_count):
+            # list table
             try:
-                res = db_obj.get_table("my_table" + str(i))
+                res = db_obj.list_tables()
+                print(res)
             except Exception as e:
                 print(e)
 
-        for i in range(tb_count):
-            try:
-                tb = db_obj.drop_table("my_table" + str(i))
-            except Exception as e:
-                print(e)
+            # get table
+            pool.map(lambda db, i: db.get_table(table_name + str(i)), range(tb_count))
 
-        # disconnect
-        res = infinity_obj.disconnect()
-        assert res.error_code == ErrorCode.OK
+            pool.map(lambda db, i: db.drop_table(table_name + str(i)), range(tb_count))
+        finally:
+            pool.disconnect()
 
     # create/drop/list/get 1M table to reach the limit
     @pytest.mark.slow
     @pytest.mark.skip(reason="Cost too much times")
-    def test_create_1M_table(self):
+    def test_create_1M_table(self, db_obj, table_name):
         """
         target: create/drop/list/get 1K table
         methods: show table
         expect: all operations successfully
         """
-        # connect
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("my_table", ConflictType.Ignore)
-
         tb_count = 1000000
-        for i in range(tb_count):
-            try:
-                tb = db_obj.create_table("my_table" + str(i), {"c1": "int"}, ConflictType.Error)
-                print(i)
-                # raise Exception(f"Can create table")
-            except Exception as e:
-                print(e)
-
-        # disconnect
-        res = infinity_obj.disconnect()
-        assert res.error_code == ErrorCode.OK
+        pool = ConnectionPool(common_values.TEST_REMOTE_HOST, min(common_values.stress_pool_size, tb_count))
+        try:
+            pool.map(lambda db, i: db.create_table(table_name + str(i), {"c1": "int"}, ConflictType.Error),
+                     range(tb_count))
+        finally:
+            pool.disconnect()
 
     # create/drop same table in different thread to test conflict
-    @trace_expected_exceptions
-    def test_create_or_drop_same_table_in_different_thread(self):
+    def test_create_or_drop_same_table_in_different_thread(self, db_obj, table_name):
         """
         target: create/drop same table in different thread to test conflict
-        methods: create table at same time for 16 times
-        expect: all operations successfully
-        """
-        # connect
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("my_table", ConflictType.Ignore)
-
-        # create table
-        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
-            # commit task into processpool
-            futures = [executor.submit(db_obj.create_table("my_table", {"c1": "int"}, ConflictType.Error), i) for i in
-                       range(16)]
-            # wait all processes finished
-            concurrent.futures.wait(futures)
-
-        # drop table
-        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
-            # commit task into threadpool
-            futures = [executor.submit(db_obj.drop_table("my_table"), i) for i in range(16)]
-            # wait all threads finished
-            concurrent.futures.wait(futures)
+        methods: create table at same time from 16 threads, then drop it at same time from 16 threads
+        expect: exactly one create and one drop succeed, the other creates raise ERROR:3017 (duplicated table)
+                and the other drops return TABLE_NOT_EXIST
+        """
+        # every thread works on its own connection
+        tls = threading.local()
+        connections = []
+
+        def thread_db():
+            if not hasattr(tls, "db"):
+                conn = infinity.connect(common_values.TEST_REMOTE_HOST)
+                connections.append(conn)
+                tls.db = conn.get_database("default")
+            return tls.db
+
+        # return the duplicated table error instead of raising it, so that the conflicts can be counted;
+        # any other error is raised again by the future's result()
+        def create_table():
+            try:
+                return thread_db().create_table(table_name, {"c1": "int"}, ConflictType.Error)
+            except Exception as e:
+                if not str(e).startswith(f"ERROR:{ErrorCode.DUPLICATE_TABLE_NAME.value},"):
+                    raise
+                return e
 
-        # disconnect
-        res = infinity_obj.disconnect()
-        assert res.error_code == ErrorCode.OK
+        thread_count = common_values.conflict_thread_count
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=thread_count) as executor:
+                # create table
+                futures = [executor.submit(create_table) for _ in range(thread_count)]
+                results = [f.result() for f in futures]
+                assert sum(1 for res in results if isinstance(res, Exception)) == thread_count - 1
+
+                # drop table
+                # drop_table reports a server-side failure in the response instead of raising
+                futures = [executor.submit(lambda: thread_db().drop_table(table_name)) for _ in range(thread_count)]
+                error_codes = [f.result().error_code for f in futures]
+                assert error_codes.count(ErrorCode.OK) == 1
+                assert error_codes.count(ErrorCode.TABLE_NOT_EXIST) == thread_count - 1
+        finally:
+            for conn in connections:
+                conn.disconnect()
 
     # create empty column table
-    def test_create_empty_column_table(self):
+    def test_create_empty_column_table(self, db_obj, table_name):
         """
         target: create empty column table
         methods: create empty column table
         expect: all operations successfully
         """
-        # connect
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("my_table", ConflictType.Ignore)
-
         try:
-            db_obj.create_table("my_table", None, ConflictType.Error)
+            db_obj.create_table(table_name, None, ConflictType.Error)
         except Exception as e:
             print(e)
 
-        # disconnect
-        res = infinity_obj.disconnect()
-        assert res.error_code == ErrorCode.OK
-
-    @pytest.mark.parametrize("types", [
-        "int", "int8", "int16", "int32", "int64", "integer",
-        "float", "float32", "double", "float64",
-        "varchar",
-        "bool",
-        "vector, 3, float"])
-    def test_create_valid_option(self, types):
-        # connect
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("test_valid_option", ConflictType.Ignore)
-
-        db_obj.create_table("test_valid_option", {"c1": types}, ConflictType.Error)
-
-        # disconnect
-        res = infinity_obj.disconnect()
-        assert res.error_code == ErrorCode.OK
+    @pytest.mark.parametrize("types", _VALID_TYPES)
+    def test_create_valid_option(self, db_obj, table_name, types):
+        db_obj.create_table(table_name, {"c1": types}, ConflictType.Error)
 
-    @pytest.mark.parametrize("types", [
-        "int", "int8", "int16", "int32", "int64", "integer",
-        "float", "float32", "double", "float64",
-        "varchar",
-        "bool",
-        "vector, 3, float"])
+    @pytest.mark.parametrize("types", _VALID_TYPES)
     @pytest.mark.parametrize("bool", [True, False])
-    def test_drop_option(self, types, bool):
-        # connect
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("test_drop_option", ConflictType.Ignore)
-
-        db_obj.create_table("test_drop_option", {"c1": types}, ConflictType.Error)
-        db_obj.drop_table("test_drop_option", ConflictType.Error)
-
-        # disconnect
-        res = infinity_obj.disconnect()
-        assert res.error_code == ErrorCode.OK
-
-    def test_create_same_name_table(self):
-        # connect
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("test_create_same_name", ConflictType.Ignore)
+    def test_drop_option(self, db_obj, table_name, types, bool):
+        db_obj.create_table(table_name, {"c1": types}, ConflictType.Error)
+        db_obj.drop_table(table_name, ConflictType.Error)
 
+    def test_create_same_name_table(self, db_obj, table_name):
         # create
-        db_obj.create_table("test_create_same_name", {"c1": "int"}, ConflictType.Error)
+        db_obj.create_table(table_name, {"c1": "int"}, ConflictType.Error)
         with pytest.raises(Exception, match="ERROR:3017*"):
-            db_obj.create_table("test_create_same_name", {"c1": "int"}, ConflictType.Error)
+            db_obj.create_table(table_name, {"c1": "int"}, ConflictType.Error)
 
-        # disconnect
-        res = infinity_obj.disconnect()
-        assert res.error_code == ErrorCode.OK
-
-    def test_drop_same_name_table(self):
-        # connect
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("test_drop_same_name", ConflictType.Ignore)
+    def test_drop_same_name_table(self, db_obj, table_name):
         # drop
-        db_obj.drop_table("test_drop_same_name")
-        # disconnect
-        res = infinity_obj.disconnect()
-        assert res.error_code == ErrorCode.OK
-
-    def test_same_column_name(self):
-        # connect
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("test_same_column_name", ConflictType.Ignore)
-
-        db_obj.create_table("test_same_column_name", {"c1": "int",
-                                                      "c1": "int"}, ConflictType.Error)
+        db_obj.drop_table(table_name)
 
-        # disconnect
-        res = infinity_obj.disconnect()
-        assert res.error_code == ErrorCode.OK
-
-    @pytest.mark.parametrize("types", [
-        "int", "int8", "int16", "int32", "int64", "integer",
-        "float", "float32", "double", "float64",
-        "varchar",
-        "bool",
-        "vector, 3, float"])
+    @pytest.mark.parametrize("types", _VALID_TYPES)
     @pytest.mark.parametrize("column_number", [[
         0, 1, pow(2, 63) - 1
     ]])
-    def test_column_numbers(self, types, column_number):
-        # connect
-        infinity_obj = infinity.connect(common_values.TEST_REMOTE_HOST)
-        db_obj = infinity_obj.get_database("default")
-        db_obj.drop_table("test_column_numbers", ConflictType.Ignore)
-
+    def test_column_numbers(self, db_obj, table_name, types, column_number):
         values = {"c" + str(i): types for i in column_number}
-        db_obj.create_table("test_column_numbers", values, ConflictType.Error)
-
-    @pytest.mark.parametrize("conflict_type", [ConflictType.Error,
-                                               ConflictType.Ignore,
-                                               ConflictType.Replace,
-                                               0,
-                                               1,
-                                               2,
-                                               ])
-    def test_table_create_valid_option(self, get_infinity_db, conflict_type):
-        db_obj = get_infinity_db
-        db_obj.drop_table("test_various_table_create_option", ConflictType.Ignore)
-        db_obj.create_table("test_various_table_create_option", {"c1": "int"}, conflict_type)
-
-
-    @pytest.mark.parametrize("conflict_type", [pytest.param(1.1),
-                                               pytest.param("#@$@!%string"),
-                                               pytest.param([]),
-                                               pytest.param({}),
-                                               pytest.param(()),
-                                               ])
-    def test_table_create_invalid_option(self, get_infinity_db, conflict_type):
-        db_obj = get_infinity_db
-        db_obj.drop_table("test_various_table_create_option", ConflictType.Ignore)
-        with pytest.raises(Exception, match=f"ERROR:3066, Invalid conflict type"):
-            db_obj.create_table("test_various_table_create_option", {"c1": "int"}, conflict_type)
-
-    @pytest.mark.parametrize("conflict_type",
-                             [ConflictType.Error,
-                              ConflictType.Ignore,
-                              0,
-                              1,
-                              ])
-    def test_table_drop_valid_option(self, get_infinity_db, conflict_type):
-        db_obj = get_infinity_db
-        db_obj.create_table("test_various_table_drop_option", {"c1": "int"}, ConflictType.Ignore)
-        db_obj.drop_table("test_various_table_drop_option", conflict_type)
-
-    @pytest.mark.parametrize("conflict_type",
-                             [pytest.param(ConflictType.Replace),
-                              pytest.param(2),
-                              pytest.param(1.1),
-                              pytest.param("#@$@!%string"),
-                              pytest.param([]),
-                              pytest.param({}),
-                              pytest.param(()),
-                              ])
-    def test_table_drop_invalid_option(self, get_infinity_db, conflict_type):
-        db_obj = get_infinity_db
-        db_obj.create_table("test_various_table_drop_option", {"c1": "int"}, ConflictType.Ignore)
-        with pytest.raises(Exception, match=f"ERROR:3066, invalid conflict type"):
-            db_obj.drop_table("test_various_table_drop_option", conflict_type)
-
-    def test_create_duplicated_table_with_ignore_option(self, get_infinity_db):
-        db_obj = get_infinity_db
-        db_obj.drop_table("test_create_duplicated_table_with_ignore_option", ConflictType.Ignore)
-
-        for i in range(100):
-            db_obj.create_table("test_create_duplicated_table_with_ignore_option", {"c1": "int"}, ConflictType.Ignore)
-
-    def test_create_duplicated_table_with_error_option(self, get_infinity_db):
-        db_obj = get_infinity_db
-        db_obj.drop_table("test_create_duplicated_table_with_error_option", ConflictType.Ignore)
-
-        with pytest.raises(Exception, match="ERROR:3017*"):
-            for i in range(100):
-                db_obj.create_table("test_create_duplicated_table_with_error_option", {"c1": "int"}, ConflictType.Error)
-
-    def test_create_duplicated_table_with_replace_option(self, get_infinity_db):
-        db_obj = get_infinity_db
-        db_obj.drop_table("test_create_duplicated_table_with_replace_option", ConflictType.Ignore)
-
-        with pytest.raises(Exception, match="ERROR:3017*"):
-            for i in range(100):
-                db_obj.create_table("test_create_duplicated_table_with_replace_option", {"c" + str(i): "int"}, ConflictType.Replace)
+        db_obj.create_table(table_name, values, ConflictType.Error)
+
+    def test_conflict_type_matrix(self, db_obj, table_name, subtests):
+        # only an Ignore create succeeds on an existing table, Error and Replace both fail with ERROR:3017
+        for conflict_type in [ConflictType.Error, ConflictType.Ignore, ConflictType.Replace, 0, 1, 2]:
+            with subtests.test(msg="create with valid option", conflict_type=conflict_type):
+                if conflict_type != ConflictType.Ignore:
+                    db_obj.drop_table(table_name, ConflictType.Ignore)
+                db_obj.create_table(table_name, {"c1": "int"}, conflict_type)
+
+        for conflict_type in [1.1, "#@$@!%string", [], {}, ()]:
+            with subtests.test(msg="create with invalid option", conflict_type=conflict_type):
+                with pytest.raises(Exception, match=_INVALID_CREATE_RE):
+                    db_obj.create_table(table_name, {"c1": "int"}, conflict_type)
+
+        for conflict_type in [ConflictType.Error, ConflictType.Ignore, 0, 1]:
+            with subtests.test(msg="drop with valid option", conflict_type=conflict_type):
+                db_obj.create_table(table_name, {"c1": "int"}, ConflictType.Ignore)
+                db_obj.drop_table(table_name, conflict_type)
+
+        # a rejected drop leaves the table in place, so it is created once for all the invalid cases
+        db_obj.create_table(table_name, {"c1": "int"}, ConflictType.Ignore)
+        for conflict_type in [ConflictType.Replace, 2, 1.1, "#@$@!%string", [], {}, ()]:
+            with subtests.test(msg="drop with invalid option", conflict_type=conflict_type):
+                with pytest.raises(Exception, match=_INVALID_DROP_RE):
+                    db_obj.drop_table(table_name, conflict_type)
+
+    def test_create_duplicated_table_with_ignore_option(self, infinity_pool, table_name):
+        # the first create makes the table, the other 99 only hit the ignore path so they can run concurrently
+        with infinity_pool.acquire() as db_obj:
+            db_obj.create_table(table_name, {"c1": "int"}, ConflictType.Ignore)
+        tables = infinity_pool.map(lambda db, _: db.create_table(table_name, {"c1": "int"}, ConflictType.Ignore),
+                                   range(99))
+        assert all(table is not None and not isinstance(table, Exception) for table in tables)
+
+    def test_create_duplicated_table_with_error_option(self, infinity_pool, table_name):
+        with infinity_pool.acquire() as db_obj:
+            db_obj.create_table(table_name, {"c1": "int"}, ConflictType.Error)
+            with pytest.raises(Exception, match="ERROR:3017"):
+                db_obj.create_table(table_name, {"c1": "int"}, ConflictType.Error)
+
+    def test_create_duplicated_table_with_replace_option(self, infinity_pool, table_name):
+        with infinity_pool.acquire() as db_obj:
+            db_obj.create_table(table_name, {"c0": "int"}, ConflictType.Replace)
+            with pytest.raises(Exception, match="ERROR:3017"):
+                db_obj.create_table(table_name, {"c1": "int"}, ConflictType.Replace)
@@ -1,10 +1,14 @@
+import concurrent.futures
+import contextlib
 import csv
 import functools
 import os
+import queue
 import subprocess
 import time
 import traceback
 from shutil import copyfile
+import infinity
 import numpy as np
 import pytest
 
@@ -28,6 +32,46 @@ def trace_expected_exceptions(func):
     return wrapped_func
 
 
+# pool of connections, every worker thread leases its own since thrift clients are not thread safe
+class ConnectionPool:
+    def __init__(self, uri, size, db_name="default"):
+        self.size = size
+        self._connections = [infinity.connect(uri) for _ in range(size)]
+        self._databases = queue.Queue()
+        for conn in self._connections:
+            self._databases.put(conn.get_database(db_name))
+
+    # lease a database handle, it goes back to the pool when the block exits
+    @contextlib.contextmanager
+    def acquire(self):
+        db_obj = self._databases.get()
+        try:
+            yield db_obj
+        finally:
+            self._databases.put(db_obj)
+
+    def with_db(self, func):
+        with self.acquire() as db_obj:
+            return func(db_obj)
+
+    # run func(db_obj, item) for every item concurrently, the exceptions are printed and returned
+    def map(self, func, items):
+        def run(item):
+            try:
+                return self.with_db(lambda db_obj: func(db_obj, item))
+            except Exception as e:
+                print(e)
+                return e
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(run, items))
+
+    def disconnect(self):
+        for conn in self._connections:
+            conn.disconnect()
+        self._connections = []
+
+
 # read fvecs file
 def read_fvecs_file(filename):
     file_int32 = np.fromfile(filename, dtype='int32')
@@ -7,22 +7,34 @@ import threading
 import time
 
 
-def python_sdk_test(python_test_dir: str, pytest_mark: str):
-    print("python test path is {}".format(python_test_dir))
-    # run test
-    print(f"start pysdk test with {pytest_mark}")
+def run_pytest(args: list, allow_empty: bool = False):
     process = subprocess.Popen(
-        # ["python", "-m", "pytest", "--tb=line", '-s', '-x', '-m', pytest_mark, f'{python_test_dir}/test'],
-        ["python", "-m", "pytest", "--tb=line", '-x', '-m', pytest_mark, f'{python_test_dir}/test'],
+        ["python", "-m", "pytest", *args],
         stdout=sys.stdout,
         stderr=sys.stderr,
         universal_newlines=True,
     )
 
     process.wait()
-    if process.returncode != 0:
+    # pytest exits with 5 when the mark selects no test
+    if process.returncode != 0 and not (allow_empty and process.returncode == 5):
         raise Exception(f"An error occurred: {process.stderr}")
 
+
+def python_sdk_test(python_test_dir: str, pytest_mark: str):
+    print("python test path is {}".format(python_test_dir))
+    # run test
+    print(f"start pysdk test with {pytest_mark}")
+    # test_table.py runs in parallel with pytest-xdist, its serial cases run alone afterwards.
+    # Its many parametrized node ids are not written to .pytest_cache, nothing reads them back in CI.
+    parallel_test = f'{python_test_dir}/test/test_table.py'
+    no_cache = ['-p', 'no:cacheprovider']
+    # run_pytest(["--tb=line", '-s', '-x', '-m', pytest_mark, f'{python_test_dir}/test'])
+    run_pytest(["--tb=line", '-x', '-m', pytest_mark, f'--ignore={parallel_test}', f'{python_test_dir}/test'])
+    run_pytest(["--tb=line", '-x', *no_cache, '-n', 'auto', '-m', f'({pytest_mark}) and not serial', parallel_test],
+               allow_empty=True)
+    run_pytest(["--tb=line", '-x', *no_cache, '-m', f'({pytest_mark}) and serial', parallel_test], allow_empty=True)
+
     print("pysdk test finished.")
 
 